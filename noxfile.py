@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-import re
 import shutil
 from pathlib import Path
 
@@ -128,10 +127,13 @@ def _bump(session: nox.Session, name: str, script: str, files) -> None:
     )
     args = parser.parse_args(session.posargs)
 
-    session.install("db-dtypes")
-    session.install("google-cloud-bigquery")
-    session.install("pandas")
-    session.install("pyarrow")
+    session.install(
+        "db-dtypes",
+        "google-cloud-bigquery",
+        "google-cloud-bigquery-storage",
+        "pandas",
+        "pyarrow",
+    )
 
     if args.version is None:
         gcp_project = "idc-external-025"
@@ -172,7 +174,7 @@ def _bump(session: nox.Session, name: str, script: str, files) -> None:
         )
 
 
-@nox.session
+@nox.session(reuse_venv=True)
 def bump(session: nox.Session) -> None:
     """
     Set to a new IDC index version, use -- <version>, otherwise will use the latest version.
@@ -195,10 +197,12 @@ def tag_release(session: nox.Session) -> None:
     """
     Print instructions for tagging a release and pushing it to GitHub.
     """
+    import tomllib
 
     session.log("Run the following commands to make a release:")
-    txt = Path("pyproject.toml").read_text()
-    current_version = next(iter(re.finditer(r'^version = "([\d\.]+)$"', txt))).group(1)
+    current_version = tomllib.loads(Path("pyproject.toml").read_text())["project"][
+        "version"
+    ]
     print(
         f"git tag --sign -m 'idc-index-data {current_version}' {current_version} main"
     )
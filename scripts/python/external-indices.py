@@ -2,24 +2,32 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from idc_index_data_manager import IDCIndexDataManager
 
 
+def _run_one(manager, file_path):
+    index_table = manager.execute_sql_query(file_path.read_text())
+    manager.create_parquet_from_table(index_table, f"{file_path.stem}.parquet")
+
+
 def main():
     project_id = os.getenv("PROJECT_ID")
     manager = IDCIndexDataManager(project_id=project_id)
     scripts_dir = Path(__file__).resolve().parent.parent
     assets_dir = scripts_dir.parent / "assets"
 
-    # Collecting all .sql files from sql_dir and assets_dir
-    sql_files = [f for f in os.listdir(assets_dir) if f.endswith(".sql")]
+    # Collecting all .sql files from assets_dir
+    sql_files = list(assets_dir.glob("*.sql"))
+    if not sql_files:
+        return
 
-    for file_name in sql_files:
-        file_path = assets_dir / file_name
-        index_df, output_basename = manager.execute_sql_query(file_path)
-        index_df.to_parquet(f"{output_basename}.parquet")
+    # The queries are independent and network-bound, and the BigQuery client
+    # is thread-safe, so run them concurrently.
+    with ThreadPoolExecutor(max_workers=min(8, len(sql_files))) as executor:
+        list(executor.map(lambda file_path: _run_one(manager, file_path), sql_files))
 
 
 if __name__ == "__main__":
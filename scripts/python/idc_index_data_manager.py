@@ -1,41 +1,269 @@
 from __future__ import annotations
 
+import concurrent.futures
 import logging
 import os
+import time
+import zipfile
 from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
 
-import pandas as pd
-from google.cloud import bigquery
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from google.cloud import bigquery, bigquery_storage
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
 class IDCIndexDataManager:
+    # Latest IDC release version cached per project ID as (timestamp, version)
+    # so that repeated invocations within one process reuse the BigQuery result.
+    _LATEST_VERSION_CACHE_TTL = 300  # seconds
+    _latest_version_cache: ClassVar[dict[str, tuple[float, int]]] = {}
+
+    # Streamed record batches are buffered up to this many bytes before being
+    # written, so the resulting Parquet file gets a few large row groups
+    # instead of one tiny row group per incoming network batch.
+    _STREAM_ROW_GROUP_TARGET_BYTES = 128 * 1024 * 1024
+
     def __init__(self, project_id: str):
         """
         Initializes the IDCIndexDataManager using the Google Cloud Platform project ID.
         """
         self.project_id = project_id
-        self.client = bigquery.Client(project=project_id)
+        self._client: bigquery.Client | None = None
+        self._bqstorage_client: bigquery_storage.BigQueryReadClient | None = None
         logger.debug("IDCIndexDataManager initialized with project ID: %s", project_id)
 
-    def execute_sql_query(self, file_path: str) -> tuple[pd.DataFrame, str]:
+    @property
+    def client(self) -> bigquery.Client:
+        """
+        Lazily created BigQuery client.
+
+        Credential discovery and the TLS handshake cost a few hundred
+        milliseconds, so managers that never issue a query themselves (such
+        as the process-pool parent in :func:`generate_index_data_files`)
+        should not pay for them.
         """
-        Executes the SQL query in the specified file.
+        if self._client is None:
+            from google.cloud import bigquery
+
+            self._client = bigquery.Client(project=self.project_id)
+        return self._client
+
+    @property
+    def bqstorage_client(self) -> bigquery_storage.BigQueryReadClient:
+        """
+        Lazily created Storage Read API client, reused across queries;
+        multi-stream Arrow downloads are an order of magnitude faster than
+        the REST paging path.
+        """
+        if self._bqstorage_client is None:
+            from google.cloud import bigquery_storage
+
+            self._bqstorage_client = bigquery_storage.BigQueryReadClient()
+        return self._bqstorage_client
+
+    def execute_sql_query(self, sql_query: str) -> pa.Table:
+        """
+        Executes the given SQL query.
 
         Returns:
-            Tuple[pd.DataFrame, str]: A tuple containing the DataFrame with query results,
-            the output basename.
-        """
-        with Path(file_path).open("r") as file:
-            sql_query = file.read()
-        index_df = self.client.query(sql_query).to_dataframe()
-        if "StudyDate" in index_df.columns:
-            index_df["StudyDate"] = index_df["StudyDate"].astype(str)
-        output_basename = Path(file_path).name.split(".")[0]
-        logger.debug("Executed SQL query from file: %s", file_path)
-        return index_df, output_basename
+            pa.Table: The Arrow table with the query results.
+        """
+        import pyarrow as pa
+
+        rows = self.client.query_and_wait(sql_query)
+        index_table = rows.to_arrow(bqstorage_client=self.bqstorage_client)
+        if "StudyDate" in index_table.column_names:
+            column_index = index_table.schema.get_field_index("StudyDate")
+            index_table = index_table.set_column(
+                column_index,
+                "StudyDate",
+                index_table.column("StudyDate").cast(pa.string()),
+            )
+        return index_table
+
+    @staticmethod
+    def _normalize_study_date(batch: pa.RecordBatch) -> pa.RecordBatch:
+        """
+        Casts the StudyDate column to string, mirroring the normalization
+        applied by :func:`execute_sql_query`.
+        """
+        import pyarrow as pa
+
+        if "StudyDate" in batch.schema.names:
+            column_index = batch.schema.get_field_index("StudyDate")
+            batch = batch.set_column(
+                column_index,
+                "StudyDate",
+                batch.column(column_index).cast(pa.string()),
+            )
+        return batch
+
+    def stream_sql_query_to_parquet(
+        self, sql_query: str, parquet_file_name: str
+    ) -> None:
+        """
+        Executes the given SQL query and streams the result straight into a
+        Parquet file.
+
+        Unlike :func:`execute_sql_query`, the full result set is never held
+        in memory: record batches arriving from the Storage Read API are
+        written as they are received, keeping peak memory at one buffered
+        row group instead of the whole table.
+
+        The Storage Read API yields many small batches; writing each one as
+        its own row group would bloat the file and cripple downstream reads,
+        so batches are coalesced to roughly
+        :attr:`_STREAM_ROW_GROUP_TARGET_BYTES` per row group first.
+        """
+        import pyarrow as pa
+        from pyarrow import parquet as pq
+
+        rows = self.client.query_and_wait(sql_query)
+        if not rows.total_rows:
+            # Empty result set: eagerly write the (empty) table so the output
+            # file still exists with the right schema. This must happen before
+            # the streaming loop below, since to_arrow() cannot be called on a
+            # RowIterator that has already started iterating.
+            self.create_parquet_from_table(
+                rows.to_arrow(bqstorage_client=self.bqstorage_client),
+                parquet_file_name,
+            )
+            return
+        tmp_file_name = f"{parquet_file_name}.tmp"
+        writer = None
+        sink = None
+        buffered: list[pa.RecordBatch] = []
+        buffered_bytes = 0
+        try:
+            for batch in rows.to_arrow_iterable(bqstorage_client=self.bqstorage_client):
+                normalized = self._normalize_study_date(batch)
+                if writer is None:
+                    # Buffer disk writes to 8 MiB chunks instead of one
+                    # syscall per encoded page.
+                    sink = pa.output_stream(tmp_file_name, buffer_size=8 * 1024 * 1024)
+                    writer = pq.ParquetWriter(
+                        sink,
+                        normalized.schema,
+                        compression="zstd",
+                        compression_level=3,
+                        use_dictionary=True,
+                        write_statistics=True,
+                        data_page_version="2.0",
+                        data_page_size=1 << 20,
+                    )
+                buffered.append(normalized)
+                buffered_bytes += normalized.nbytes
+                if buffered_bytes >= self._STREAM_ROW_GROUP_TARGET_BYTES:
+                    writer.write_table(pa.Table.from_batches(buffered).combine_chunks())
+                    buffered = []
+                    buffered_bytes = 0
+            if writer is not None and buffered:
+                writer.write_table(pa.Table.from_batches(buffered).combine_chunks())
+        finally:
+            if writer is not None:
+                writer.close()
+            if sink is not None:
+                sink.close()
+        if writer is None:
+            msg = (
+                f"Received no record batches for the {rows.total_rows} row(s) "
+                f"expected in {parquet_file_name}"
+            )
+            raise RuntimeError(msg)
+        Path(tmp_file_name).replace(parquet_file_name)
+
+    def create_csv_zip_from_table(
+        self, index_table: pa.Table, csv_file_name: str
+    ) -> None:
+        """
+        Writes the Arrow table as a zip archive containing a single CSV file.
+
+        The CSV is encoded with PyArrow's multithreaded writer, which is
+        considerably faster than :meth:`pandas.DataFrame.to_csv` for the wide,
+        string-heavy index tables.
+        """
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        buffer = pa.BufferOutputStream()
+        pa_csv.write_csv(index_table, buffer)
+        tmp_file_name = f"{csv_file_name}.tmp"
+        with zipfile.ZipFile(
+            tmp_file_name, "w", compression=zipfile.ZIP_DEFLATED
+        ) as zip_file:
+            zip_file.writestr(Path(csv_file_name).stem, buffer.getvalue().to_pybytes())
+        Path(tmp_file_name).replace(csv_file_name)
+
+    def create_parquet_from_table(
+        self, index_table: pa.Table, parquet_file_name: str
+    ) -> None:
+        """
+        Writes the Arrow table as a Parquet file tuned for the index tables.
+
+        ZSTD level 3 compresses noticeably better than the Snappy default at
+        comparable decode speed, dictionary encoding collapses the highly
+        repetitive DICOM string columns, and moderately sized row groups let
+        downstream readers stream the file instead of loading 64 MB chunks.
+        The row group size can be overridden through the
+        IDC_INDEX_DATA_PARQUET_ROW_GROUP_SIZE environment variable.
+        """
+        from pyarrow import parquet as pq
+
+        row_group_size = int(
+            os.environ.get("IDC_INDEX_DATA_PARQUET_ROW_GROUP_SIZE", "256000")
+        )
+        tmp_file_name = f"{parquet_file_name}.tmp"
+        pq.write_table(
+            index_table,
+            tmp_file_name,
+            compression="zstd",
+            compression_level=3,
+            row_group_size=row_group_size,
+            use_dictionary=True,
+            write_statistics=True,
+            data_page_version="2.0",
+            data_page_size=1 << 20,
+        )
+        Path(tmp_file_name).replace(parquet_file_name)
+
+    def process_sql_file(
+        self,
+        file_path: str,
+        generate_compressed_csv: bool = True,
+        generate_parquet: bool = False,
+    ) -> None:
+        """
+        Executes the query in the specified SQL file and writes the
+        resulting Arrow table as compressed CSV and/or Parquet file.
+
+        When only Parquet output is requested, the result is streamed into
+        the file batch by batch instead of being materialized in full.
+        """
+        sql_query = Path(file_path).read_text()
+        output_basename = Path(file_path).stem
+
+        if generate_parquet and not generate_compressed_csv:
+            parquet_file_name = f"{output_basename}.parquet"
+            self.stream_sql_query_to_parquet(sql_query, parquet_file_name)
+            logger.debug("Created Parquet file: %s", parquet_file_name)
+            return
+
+        index_table = self.execute_sql_query(sql_query)
+        logger.debug("Executed and processed SQL queries from file: %s", file_path)
+
+        if generate_compressed_csv:
+            csv_file_name = f"{output_basename}.csv.zip"
+            self.create_csv_zip_from_table(index_table, csv_file_name)
+            logger.debug("Created CSV zip file: %s", csv_file_name)
+
+        if generate_parquet:
+            parquet_file_name = f"{output_basename}.parquet"
+            self.create_parquet_from_table(index_table, parquet_file_name)
+            logger.debug("Created Parquet file: %s", parquet_file_name)
 
     def generate_index_data_files(
         self, generate_compressed_csv: bool = True, generate_parquet: bool = False
@@ -44,32 +272,41 @@ class IDCIndexDataManager:
         Generates index-data files locally by executing queries against
         the Google Cloud Platform IDC project tables.
 
-        This method iterates over SQL files in the 'scripts/sql' directory,
-        executing each query using :func:`execute_sql_query` and generating a DataFrame,
-        'index_df'. The DataFrame is then saved as compressed CSV and/or Parquet file.
+        This method collects the SQL files in the 'scripts/sql' directory and
+        processes them concurrently, one worker process per file, using
+        :func:`process_sql_file`. The queries are network-bound while the
+        CSV/Parquet compression is CPU-bound, so independent files scale with
+        a process pool.
         """
 
         scripts_dir = Path(__file__).parent.parent
         sql_dir = scripts_dir / "sql"
 
-        for file_name in os.listdir(sql_dir):
-            if file_name.endswith(".sql"):
-                file_path = Path(sql_dir) / file_name
-                index_df, output_basename = self.execute_sql_query(file_path)
-                logger.debug(
-                    "Executed and processed SQL queries from file: %s", file_path
-                )
-            if generate_compressed_csv:
-                csv_file_name = f"{output_basename}.csv.zip"
-                index_df.to_csv(
-                    csv_file_name, compression={"method": "zip"}, escapechar="\\"
-                )
-                logger.debug("Created CSV zip file: %s", csv_file_name)
-
-            if generate_parquet:
-                parquet_file_name = f"{output_basename}.parquet"
-                index_df.to_parquet(parquet_file_name, compression="zstd")
-                logger.debug("Created Parquet file: %s", parquet_file_name)
+        with os.scandir(sql_dir) as dir_entries:
+            sql_paths = [
+                entry.path
+                for entry in dir_entries
+                if entry.is_file() and entry.name.endswith(".sql")
+            ]
+
+        if not sql_paths:
+            return
+
+        max_workers = min(len(sql_paths), os.cpu_count() or 1)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(
+                    _process_sql_file_worker,
+                    self.project_id,
+                    sql_path,
+                    generate_compressed_csv,
+                    generate_parquet,
+                ): sql_path
+                for sql_path in sql_paths
+            }
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+                logger.debug("Completed processing of: %s", futures[future])
 
     def retrieve_latest_idc_release_version(self) -> int:
         """
@@ -77,17 +314,42 @@ class IDCIndexDataManager:
 
         This function executes a SQL query on the `version_metadata` table in the
         `idc_current` dataset of the BigQuery client. It retrieves the maximum
-        `idc_version` and returns it as an integer.
+        `idc_version` and returns it as an integer. Results are cached for
+        a few minutes so that repeated calls do not re-query BigQuery.
         """
+        cached = self._latest_version_cache.get(self.project_id)
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < self._LATEST_VERSION_CACHE_TTL
+        ):
+            return cached[1]
         query = """
         SELECT
             MAX(idc_version) AS latest_idc_release_version
         FROM
             `bigquery-public-data.idc_current.version_metadata`
         """
-        query_job = self.client.query(query)
-        result = query_job.result()
-        return int(next(result).latest_idc_release_version)
+        rows = self.client.query_and_wait(query)
+        version = int(next(iter(rows)).latest_idc_release_version)
+        self._latest_version_cache[self.project_id] = (time.monotonic(), version)
+        return version
+
+
+def _process_sql_file_worker(
+    project_id: str,
+    file_path: str,
+    generate_compressed_csv: bool,
+    generate_parquet: bool,
+) -> None:
+    """
+    Process-pool worker processing a single SQL file.
+
+    A new :class:`IDCIndexDataManager` is created in each worker because the
+    BigQuery client holds network connections that must not cross process
+    boundaries.
+    """
+    manager = IDCIndexDataManager(project_id)
+    manager.process_sql_file(file_path, generate_compressed_csv, generate_parquet)
 
 
 if __name__ == "__main__":
@@ -122,7 +384,7 @@ if __name__ == "__main__":
             "Set GCP_PROJECT environment variable or specify --project argument"
         )
 
-    if any([args.generate_csv_archive, args.generate_parquet]):
+    if args.generate_csv_archive or args.generate_parquet:
         IDCIndexDataManager(args.project).generate_index_data_files(
             generate_compressed_csv=args.generate_csv_archive,
             generate_parquet=args.generate_parquet,
@@ -14,6 +14,10 @@ from pathlib import Path
 
 ROOT_DIR = Path(__file__).parent / "../.."
 
+PYPROJECT_VERSION_RE = re.compile(r'^version = "[\w\.]+"$', re.MULTILINE)
+SQL_DATASET_VERSION_RE = re.compile(r"idc_v\d+")
+TESTS_EXPECTED_VERSION_RE = re.compile(r"EXPECTED_IDC_INDEX_VERSION = \d+")
+
 
 @contextlib.contextmanager
 def _log(txt, verbose=True):
@@ -24,35 +28,34 @@ def _log(txt, verbose=True):
         print(f"{txt} - done")  # noqa: T201
 
 
-def _update_file(filepath, regex, replacement):
+def _update_file(filepath, pattern, replacement):
     msg = "Updating %s" % os.path.relpath(str(filepath), ROOT_DIR)
     with _log(msg):
-        pattern = re.compile(regex)
-        with filepath.open() as doc_file:
-            lines = doc_file.readlines()
-            updated_content = []
-            for line in lines:
-                updated_content.append(re.sub(pattern, replacement, line))
-        with filepath.open("w") as doc_file:
-            doc_file.writelines(updated_content)
+        content = filepath.read_text()
+        updated_content = pattern.sub(replacement, content)
+        if updated_content == content:
+            # Nothing changed: skip the write so unchanged files keep their mtime.
+            return
+        filepath.write_text(updated_content)
 
 
 def update_pyproject_toml(idc_index_version):
-    pattern = re.compile(r'^version = "[\w\.]+"$')
     replacement = f'version = "{idc_index_version}.0.0"'
-    _update_file(ROOT_DIR / "pyproject.toml", pattern, replacement)
+    _update_file(ROOT_DIR / "pyproject.toml", PYPROJECT_VERSION_RE, replacement)
 
 
 def update_sql_scripts(idc_index_version):
-    pattern = re.compile(r"idc_v\d+")
     replacement = f"idc_v{idc_index_version}"
-    _update_file(ROOT_DIR / "scripts/sql/idc_index.sql", pattern, replacement)
+    _update_file(
+        ROOT_DIR / "scripts/sql/idc_index.sql", SQL_DATASET_VERSION_RE, replacement
+    )
 
 
 def update_tests(idc_index_version):
-    pattern = re.compile(r"EXPECTED_IDC_INDEX_VERSION = \d+")
     replacement = f"EXPECTED_IDC_INDEX_VERSION = {idc_index_version}"
-    _update_file(ROOT_DIR / "tests/test_package.py", pattern, replacement)
+    _update_file(
+        ROOT_DIR / "tests/test_package.py", TESTS_EXPECTED_VERSION_RE, replacement
+    )
 
 
 def main():
@@ -10,7 +10,7 @@ SELECT
   ANY_VALUE(PatientAge) AS PatientAge,
   ANY_VALUE(PatientSex) AS PatientSex,
   # study level attributes
-  ANY_VALUE(StudyDate) AS StudyDate,
+  ANY_VALUE(SAFE_CAST(StudyDate AS STRING)) AS StudyDate,
   ANY_VALUE(StudyDescription) AS StudyDescription,
   ANY_VALUE(dicom_curated.BodyPartExamined) AS BodyPartExamined,
   # series level attributes
@@ -6,7 +6,9 @@ idc-index-data: ImagingDataCommons index to query and download data.
 
 from __future__ import annotations
 
-from importlib.metadata import distribution
+import functools
+import os
+from importlib.metadata import PackagePath, distribution
 from pathlib import Path
 
 from ._version import version as __version__
@@ -18,14 +20,26 @@ __all__ = [
     "PRIOR_VERSIONS_INDEX_PARQUET_FILEPATH",
 ]
 
+# Distribution files are scanned once at import; each lookup below is then
+# a dict hit instead of a linear scan over every packaged file.
+_FILE_INDEX: dict[str, PackagePath] = {
+    str(file): file for file in distribution("idc_index_data").files or []
+}
 
+
+@functools.lru_cache(maxsize=None)
 def _lookup(path: str, optional: bool = False) -> Path | None:
-    """Support editable installation by looking up path using distribution API."""
-    files = distribution("idc_index_data").files
-    if files is not None:
-        for _file in files:
-            if str(_file) == path:
-                return Path(str(_file.locate())).resolve(strict=True)
+    """Support editable installation by looking up path using distribution API.
+
+    Results are memoized: resolving a path stats the filesystem, and the
+    same paths are requested repeatedly in long-lived processes.
+    """
+    file = _FILE_INDEX.get(path)
+    if file is not None:
+        located = file.locate()
+        if not isinstance(located, Path):
+            located = Path(os.fspath(located))
+        return located.resolve(strict=True)
     if optional:
         return None
 
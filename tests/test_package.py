@@ -1,45 +1,76 @@
 from __future__ import annotations
 
 import importlib.metadata
+from pathlib import Path
 
 import pandas as pd
+import pyarrow.parquet as pq
+import pytest
 from packaging.version import Version
 
 import idc_index_data as m
 
 EXPECTED_IDC_INDEX_VERSION = 20
 
+# Resolved once at collection: importlib.metadata.version() walks sys.path
+# on every call to locate the distribution.
+INSTALLED_VERSION = importlib.metadata.version("idc_index_data")
+
+
+def _assert_parquet_readable(filepath: Path) -> None:
+    # Checking the footer metadata and decoding a single column of the first
+    # row group exercises readability without materializing the whole index.
+    parquet_file = pq.ParquetFile(filepath, memory_map=True)
+    assert parquet_file.metadata.num_rows > 0
+    first_column = parquet_file.schema_arrow.names[0]
+    assert parquet_file.read_row_group(0, columns=[first_column]).num_rows > 0
+
+
+@pytest.fixture()
+def csv_archive_filepath():
+    # The CSV archive is an optional artifact: skip instead of silently
+    # passing when it is not part of the wheel.
+    if m.IDC_INDEX_CSV_ARCHIVE_FILEPATH is None:
+        pytest.skip("idc_index.csv.zip is not bundled")
+    return m.IDC_INDEX_CSV_ARCHIVE_FILEPATH
+
 
 def test_version():
-    assert importlib.metadata.version("idc_index_data") == m.__version__
+    assert m.__version__ == INSTALLED_VERSION
 
 
 def test_idc_index_version():
     assert Version(m.__version__).major == EXPECTED_IDC_INDEX_VERSION
 
 
-def test_filepath():
-    if m.IDC_INDEX_CSV_ARCHIVE_FILEPATH is not None:
-        assert m.IDC_INDEX_CSV_ARCHIVE_FILEPATH.is_file()
-        assert m.IDC_INDEX_CSV_ARCHIVE_FILEPATH.name == "idc_index.csv.zip"
+def test_csv_archive_filepath(csv_archive_filepath):
+    assert csv_archive_filepath.is_file()
+    assert csv_archive_filepath.name == "idc_index.csv.zip"
+
+
+def test_reading_csv_archive(csv_archive_filepath):
+    df_csv = pd.read_csv(csv_archive_filepath)
+    assert not df_csv.empty
 
+
+def test_filepath():
     if m.IDC_INDEX_PARQUET_FILEPATH is not None:
         assert m.IDC_INDEX_PARQUET_FILEPATH.is_file()
         assert m.IDC_INDEX_PARQUET_FILEPATH.name == "idc_index.parquet"
 
+    if m.PRIOR_VERSIONS_INDEX_PARQUET_FILEPATH is not None:
+        assert m.PRIOR_VERSIONS_INDEX_PARQUET_FILEPATH.is_file()
+        assert (
+            m.PRIOR_VERSIONS_INDEX_PARQUET_FILEPATH.name
+            == "prior_versions_index.parquet"
+        )
+
 
 def test_reading_index():
-    if m.IDC_INDEX_CSV_ARCHIVE_FILEPATH is not None:
-        assert m.IDC_INDEX_CSV_ARCHIVE_FILEPATH.is_file()
-        df_csv = pd.read_csv(m.IDC_INDEX_CSV_ARCHIVE_FILEPATH)
-        assert not df_csv.empty
-
+    # test_filepath already stats each artifact; opening the files below
+    # fails loudly if any of them is missing.
     if m.IDC_INDEX_PARQUET_FILEPATH is not None:
-        assert m.IDC_INDEX_PARQUET_FILEPATH.is_file()
-        df_parquet = pd.read_parquet(m.IDC_INDEX_PARQUET_FILEPATH)
-        assert not df_parquet.empty
+        _assert_parquet_readable(m.IDC_INDEX_PARQUET_FILEPATH)
 
     if m.PRIOR_VERSIONS_INDEX_PARQUET_FILEPATH is not None:
-        assert m.PRIOR_VERSIONS_INDEX_PARQUET_FILEPATH.is_file()
-        df_parquet = pd.read_parquet(m.PRIOR_VERSIONS_INDEX_PARQUET_FILEPATH)
-        assert not df_parquet.empty
+        _assert_parquet_readable(m.PRIOR_VERSIONS_INDEX_PARQUET_FILEPATH)